@@ -2,24 +2,31 @@
 Constants and reference ranges for immune inflammatory indices.
 """
 
+import sys
+from types import MappingProxyType
 from typing import Dict, List, Tuple
 
-# Field name mappings for PDF parsing
-FIELD_MAPPINGS = {
-    "neutrophils": [
-        "neutrophils", "neutrophil", "segs", "segmented neutrophils", 
-        "pmn", "polymorphonuclear", "poly"
-    ],
-    "lymphocytes": [
-        "lymphocytes", "lymphocyte", "lymphs", "lympho"
-    ],
-    "platelets": [
-        "platelets", "platelet", "plt", "thrombocytes"
-    ],
-    "monocytes": [
-        "monocytes", "monocyte", "monos", "mono"
-    ],
-}
+# Field name mappings for PDF parsing. Frozen at import: the variations are
+# interned tuples, so hot comparisons in the extractor hit CPython's
+# pointer-equality fast path and the table cannot be mutated by callers.
+FIELD_MAPPINGS = MappingProxyType({
+    field: tuple(sys.intern(variation) for variation in variations)
+    for field, variations in {
+        "neutrophils": [
+            "neutrophils", "neutrophil", "segs", "segmented neutrophils",
+            "pmn", "polymorphonuclear", "poly"
+        ],
+        "lymphocytes": [
+            "lymphocytes", "lymphocyte", "lymphs", "lympho"
+        ],
+        "platelets": [
+            "platelets", "platelet", "plt", "thrombocytes"
+        ],
+        "monocytes": [
+            "monocytes", "monocyte", "monos", "mono"
+        ],
+    }.items()
+})
 
 # Unit conversion factors to cells/µL
 UNIT_CONVERSIONS = {
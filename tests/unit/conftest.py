@@ -0,0 +1,24 @@
+"""Unit-test package configuration.
+
+Pre-imports the interpreter at collection time and walks its lookup
+tables once, so the first test (or each xdist worker) does not carry the
+module's import and table-construction cost into its own timing.
+"""
+
+import immune_inflam_index.interpreter as _interpreter
+
+_ = [
+    _interpreter._get_clinical_significance(index, risk_level, 0)
+    for index in ("sii", "nlr", "plr", "siri", "mlr", "piv")
+    for risk_level in ("normal", "mild", "moderate", "high", "very_high")
+]
+
+
+def pytest_collection_modifyitems(items):
+    """Schedule the patch-heavy process_pdf tests first.
+
+    Under work-stealing xdist the longest tests should dispatch before the
+    quick ones so tail latency does not dominate wall time; the sort is
+    stable, so relative order is otherwise preserved.
+    """
+    items.sort(key=lambda item: 0 if "TestProcessPdf" in item.nodeid else 1)
@@ -1,53 +1,146 @@
 """Unit tests for the pdf_parser module."""
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import DEFAULT, patch, Mock, MagicMock, mock_open
 from pathlib import Path
 from typing import Dict, Any
 
+from immune_inflam_index import pdf_parser as _pp
 from immune_inflam_index.pdf_parser import (
     PDFParsingError, extract_text_from_pdf, extract_text_with_ocr,
     determine_extraction_method, find_cbc_section, process_pdf,
     manual_fallback_mode
 )
 
+# Shared report-text fixtures, built once at import.
+_CBC_WITH_HEADER_TEXT = """
+        PATIENT INFORMATION
+        Name: John Doe
+
+        COMPLETE BLOOD COUNT
+        Neutrophils: 6.31 x10³/L
+        Lymphocytes: 1.8 x10³/L
+        Platelets: 250 x10³/L
+
+        KIDNEY FUNCTION
+        Creatinine: 1.0 mg/dL
+        """
+
+_CBC_LOWERCASE_TEXT = """
+        complete blood count
+        Neutrophils: 6.31 x10³/L
+        Lymphocytes: 1.8 x10³/L
+        """
+
+_LONG_TEXT = "A" * 5000
+
+
+class FakePage:
+    """Minimal pdfplumber page stand-in for the text extraction tests."""
+
+    __slots__ = ("_text",)
+
+    def __init__(self, text):
+        self._text = text
+
+    def extract_text(self):
+        return self._text
+
+
+class _PdfCtx:
+    """Context-manager stub standing in for a pdfplumber.open() handle."""
+
+    __slots__ = ("pdf",)
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+
+    def __enter__(self):
+        return self.pdf
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _mock_ocr_chain(pages=1):
+    """Build the pdf -> page -> image mock graph shared by the OCR tests."""
+    image = Mock()
+    page_image = Mock(original=image)
+    page = Mock()
+    page.to_image.return_value = page_image
+    pdf = Mock()
+    pdf.pages = [page] * pages
+    return pdf, image
+
+
+# Pre-built side-effect exceptions reused across error-path tests.
+_PDF_CORRUPTION_ERR = Exception("PDF corruption error")
+_OCR_ERR = Exception("OCR processing error")
+_TEXT_EXTRACTION_ERR = Exception("Text extraction failed")
+_UNEXPECTED_ERR = Exception("Unexpected error")
+
+# Extracted CBC values shared by the happy-path process tests.
+_SAMPLE_CBC_VALUES = MappingProxyType({
+    "neutrophils": {"value": 6310, "confidence": 95},
+    "lymphocytes": {"value": 1800, "confidence": 90},
+    "platelets": {"value": 250000, "confidence": 98}
+})
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _cached_find_cbc_section():
+    """Memoise find_cbc_section so repeated identical inputs skip the scan.
+
+    Only the direct calls in this module are wrapped; production code and
+    the patched TestProcessPdf collaborators are untouched.
+    """
+    cached = lru_cache(maxsize=32)(find_cbc_section)
+    with patch.object(sys.modules[__name__], "find_cbc_section", cached):
+        yield
+
+
+@pytest.fixture
+def existing_path_mock():
+    """Patch pdf_parser.Path to report an existing file at /test/path.pdf."""
+    with patch.object(_pp, 'Path') as mock_path:
+        instance = Mock()
+        instance.exists.return_value = True
+        instance.absolute.return_value = "/test/path.pdf"
+        mock_path.return_value = instance
+        yield mock_path, instance
+
 
 class TestPDFParsingError:
     """Test custom PDF parsing exception."""
     
-    def test_pdf_parsing_error_basic(self):
-        """Test basic PDFParsingError creation."""
-        error = PDFParsingError("Test error message")
-        
-        assert str(error) == "Test error message"
-        assert error.extracted_text == ""
-        assert error.missing_fields == []
-    
-    def test_pdf_parsing_error_with_details(self):
-        """Test PDFParsingError with additional details."""
-        extracted_text = "Some extracted text"
-        missing_fields = ["neutrophils", "lymphocytes"]
-        
-        error = PDFParsingError("Test error", extracted_text, missing_fields)
-        
-        assert str(error) == "Test error"
-        assert error.extracted_text == extracted_text
-        assert error.missing_fields == missing_fields
+    @pytest.mark.parametrize("args,expected_text,expected_missing", [
+        (("Test error message",), "", []),
+        (("Test error", "Some extracted text", ["neutrophils", "lymphocytes"]),
+         "Some extracted text", ["neutrophils", "lymphocytes"]),
+    ], ids=["basic", "with_details"])
+    def test_pdf_parsing_error(self, args, expected_text, expected_missing):
+        """Test PDFParsingError creation with and without details."""
+        error = PDFParsingError(*args)
+
+        assert str(error) == args[0]
+        assert error.extracted_text == expected_text
+        assert error.missing_fields == expected_missing
 
 
 class TestExtractTextFromPdf:
     """Test PDF text extraction."""
     
-    @patch('immune_inflam_index.pdf_parser.pdfplumber.open')
+    @patch.object(_pp.pdfplumber, 'open')
     def test_extract_text_success(self, mock_open_pdf):
         """Test successful text extraction from PDF."""
         # Mock PDF with text content
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = "Test page content"
-        
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_page]
-        mock_open_pdf.return_value.__enter__.return_value = mock_pdf
+        mock_pdf = Mock()
+        mock_pdf.pages = [FakePage("Test page content")]
+        mock_open_pdf.return_value = _PdfCtx(mock_pdf)
         
         text, method = extract_text_from_pdf("test.pdf")
         
@@ -55,44 +148,36 @@ class TestExtractTextFromPdf:
         assert method == "text_based"
         mock_open_pdf.assert_called_once_with("test.pdf")
     
-    @patch('immune_inflam_index.pdf_parser.pdfplumber.open')
+    @patch.object(_pp.pdfplumber, 'open')
     def test_extract_text_multiple_pages(self, mock_open_pdf):
         """Test text extraction from multiple pages."""
         # Mock PDF with multiple pages
-        mock_page1 = MagicMock()
-        mock_page1.extract_text.return_value = "Page 1 content"
-        mock_page2 = MagicMock()
-        mock_page2.extract_text.return_value = "Page 2 content"
-        
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_page1, mock_page2]
-        mock_open_pdf.return_value.__enter__.return_value = mock_pdf
+        mock_pdf = Mock()
+        mock_pdf.pages = [FakePage("Page 1 content"), FakePage("Page 2 content")]
+        mock_open_pdf.return_value = _PdfCtx(mock_pdf)
         
         text, method = extract_text_from_pdf("test.pdf")
         
         assert text == "Page 1 content\nPage 2 content"
         assert method == "text_based"
     
-    @patch('immune_inflam_index.pdf_parser.pdfplumber.open')
+    @patch.object(_pp.pdfplumber, 'open')
     def test_extract_text_no_content(self, mock_open_pdf):
         """Test extraction when PDF has no extractable text."""
         # Mock PDF with no text content
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = None
-        
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_page]
-        mock_open_pdf.return_value.__enter__.return_value = mock_pdf
+        mock_pdf = Mock()
+        mock_pdf.pages = [FakePage(None)]
+        mock_open_pdf.return_value = _PdfCtx(mock_pdf)
         
         text, method = extract_text_from_pdf("test.pdf")
         
         assert text == ""
         assert method == "text_based_failed"
     
-    @patch('immune_inflam_index.pdf_parser.pdfplumber.open')
+    @patch.object(_pp.pdfplumber, 'open')
     def test_extract_text_error(self, mock_open_pdf):
         """Test error handling during text extraction."""
-        mock_open_pdf.side_effect = Exception("PDF corruption error")
+        mock_open_pdf.side_effect = _PDF_CORRUPTION_ERR
         
         with pytest.raises(PDFParsingError, match="Failed to extract text from PDF"):
             extract_text_from_pdf("test.pdf")
@@ -101,21 +186,13 @@ class TestExtractTextFromPdf:
 class TestExtractTextWithOcr:
     """Test OCR text extraction."""
     
-    @patch('immune_inflam_index.pdf_parser.pytesseract.image_to_string')
-    @patch('immune_inflam_index.pdf_parser.pdfplumber.open')
+    @patch.object(_pp.pytesseract, 'image_to_string')
+    @patch.object(_pp.pdfplumber, 'open')
     def test_extract_text_ocr_success(self, mock_open_pdf, mock_ocr):
         """Test successful OCR extraction."""
         # Mock PDF page to image conversion
-        mock_image = MagicMock()
-        mock_page_image = MagicMock()
-        mock_page_image.original = mock_image
-        
-        mock_page = MagicMock()
-        mock_page.to_image.return_value = mock_page_image
-        
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_page]
-        mock_open_pdf.return_value.__enter__.return_value = mock_pdf
+        mock_pdf, mock_image = _mock_ocr_chain()
+        mock_open_pdf.return_value = _PdfCtx(mock_pdf)
         
         # Mock OCR result
         mock_ocr.return_value = "OCR extracted text"
@@ -126,21 +203,13 @@ class TestExtractTextWithOcr:
         assert method == "ocr"
         mock_ocr.assert_called_once_with(mock_image)
     
-    @patch('immune_inflam_index.pdf_parser.pytesseract.image_to_string')
-    @patch('immune_inflam_index.pdf_parser.pdfplumber.open')
+    @patch.object(_pp.pytesseract, 'image_to_string')
+    @patch.object(_pp.pdfplumber, 'open')
     def test_extract_text_ocr_no_content(self, mock_open_pdf, mock_ocr):
         """Test OCR when no text is found."""
         # Mock setup
-        mock_image = MagicMock()
-        mock_page_image = MagicMock()
-        mock_page_image.original = mock_image
-        
-        mock_page = MagicMock()
-        mock_page.to_image.return_value = mock_page_image
-        
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_page]
-        mock_open_pdf.return_value.__enter__.return_value = mock_pdf
+        mock_pdf, mock_image = _mock_ocr_chain()
+        mock_open_pdf.return_value = _PdfCtx(mock_pdf)
         
         # Mock OCR returning empty text
         mock_ocr.return_value = "   "  # Only whitespace
@@ -150,10 +219,10 @@ class TestExtractTextWithOcr:
         assert text == ""
         assert method == "ocr_failed"
     
-    @patch('immune_inflam_index.pdf_parser.pdfplumber.open')
+    @patch.object(_pp.pdfplumber, 'open')
     def test_extract_text_ocr_error(self, mock_open_pdf):
         """Test error handling during OCR extraction."""
-        mock_open_pdf.side_effect = Exception("OCR processing error")
+        mock_open_pdf.side_effect = _OCR_ERR
         
         with pytest.raises(PDFParsingError, match="OCR extraction failed"):
             extract_text_with_ocr("test.pdf")
@@ -162,7 +231,7 @@ class TestExtractTextWithOcr:
 class TestDetermineExtractionMethod:
     """Test extraction method determination."""
     
-    @patch('immune_inflam_index.pdf_parser.extract_text_from_pdf')
+    @patch.object(_pp, 'extract_text_from_pdf')
     def test_determine_method_text_based(self, mock_extract):
         """Test determination when text-based extraction works."""
         # Mock successful text extraction with substantial content
@@ -173,7 +242,7 @@ class TestDetermineExtractionMethod:
         
         assert method == "text_based"
     
-    @patch('immune_inflam_index.pdf_parser.extract_text_from_pdf')
+    @patch.object(_pp, 'extract_text_from_pdf')
     def test_determine_method_ocr_needed(self, mock_extract):
         """Test determination when OCR is needed."""
         # Mock text extraction with insufficient content
@@ -184,10 +253,10 @@ class TestDetermineExtractionMethod:
         
         assert method == "ocr"
     
-    @patch('immune_inflam_index.pdf_parser.extract_text_from_pdf')
+    @patch.object(_pp, 'extract_text_from_pdf')
     def test_determine_method_error_fallback(self, mock_extract):
         """Test fallback to OCR when text extraction fails."""
-        mock_extract.side_effect = Exception("Text extraction failed")
+        mock_extract.side_effect = _TEXT_EXTRACTION_ERR
         
         method = determine_extraction_method("test.pdf")
         
@@ -199,20 +268,7 @@ class TestFindCbcSection:
     
     def test_find_cbc_section_with_header(self):
         """Test finding CBC section with clear header."""
-        text = """
-        PATIENT INFORMATION
-        Name: John Doe
-        
-        COMPLETE BLOOD COUNT
-        Neutrophils: 6.31 x10³/L
-        Lymphocytes: 1.8 x10³/L
-        Platelets: 250 x10³/L
-        
-        KIDNEY FUNCTION
-        Creatinine: 1.0 mg/dL
-        """
-        
-        cbc_section = find_cbc_section(text)
+        cbc_section = find_cbc_section(_CBC_WITH_HEADER_TEXT)
         
         assert "COMPLETE BLOOD COUNT" in cbc_section
         assert "Neutrophils" in cbc_section
@@ -221,26 +277,24 @@ class TestFindCbcSection:
         # Should not include kidney function section
         assert "KIDNEY FUNCTION" not in cbc_section or cbc_section.find("KIDNEY") > cbc_section.find("Platelets")
     
-    def test_find_cbc_section_alternative_headers(self):
+    @pytest.mark.parametrize("header", [
+        "CBC WITH DIFFERENTIAL",
+        "HEMATOLOGY",
+        "BLOOD COUNT",
+        "FBC"
+    ])
+    def test_find_cbc_section_alternative_headers(self, header):
         """Test finding CBC section with alternative headers."""
-        headers_to_test = [
-            "CBC WITH DIFFERENTIAL",
-            "HEMATOLOGY",
-            "BLOOD COUNT",
-            "FBC"
-        ]
-        
-        for header in headers_to_test:
-            text = f"""
-            {header}
-            Neutrophils: 6.31 x10³/L
-            Lymphocytes: 1.8 x10³/L
-            """
-            
-            cbc_section = find_cbc_section(text)
-            
-            assert header in cbc_section or header.lower() in cbc_section.lower()
-            assert "Neutrophils" in cbc_section
+        text = f"""
+        {header}
+        Neutrophils: 6.31 x10³/L
+        Lymphocytes: 1.8 x10³/L
+        """
+
+        cbc_section = find_cbc_section(text)
+
+        assert header in cbc_section or header.lower() in cbc_section.lower()
+        assert "Neutrophils" in cbc_section
     
     def test_find_cbc_section_no_header(self):
         """Test CBC section finding when no header is present."""
@@ -254,13 +308,7 @@ class TestFindCbcSection:
     
     def test_find_cbc_section_case_insensitive(self):
         """Test CBC section finding is case insensitive."""
-        text = """
-        complete blood count
-        Neutrophils: 6.31 x10³/L
-        Lymphocytes: 1.8 x10³/L
-        """
-        
-        cbc_section = find_cbc_section(text)
+        cbc_section = find_cbc_section(_CBC_LOWERCASE_TEXT)
         
         assert "complete blood count" in cbc_section.lower()
         assert "Neutrophils" in cbc_section
@@ -269,7 +317,7 @@ class TestFindCbcSection:
 class TestProcessPdf:
     """Test main PDF processing function."""
     
-    @patch('immune_inflam_index.pdf_parser.Path')
+    @patch.object(_pp, 'Path')
     def test_process_pdf_file_not_found(self, mock_path):
         """Test process_pdf with non-existent file."""
         # Mock file not existing
@@ -280,196 +328,165 @@ class TestProcessPdf:
         with pytest.raises(PDFParsingError, match="PDF file not found"):
             process_pdf("nonexistent.pdf")
     
-    @patch('immune_inflam_index.pdf_parser.interpret_results')
-    @patch('immune_inflam_index.pdf_parser.calculate_indices')
-    @patch('immune_inflam_index.pdf_parser.validate_demographic_extraction')
-    @patch('immune_inflam_index.pdf_parser.extract_patient_demographics')
-    @patch('immune_inflam_index.pdf_parser.validate_pdf_extracted_values')
-    @patch('immune_inflam_index.pdf_parser.extract_cbc_values')
-    @patch('immune_inflam_index.pdf_parser.find_cbc_section')
-    @patch('immune_inflam_index.pdf_parser.determine_extraction_method')
-    @patch('immune_inflam_index.pdf_parser.extract_text_from_pdf')
-    @patch('immune_inflam_index.pdf_parser.Path')
-    def test_process_pdf_successful_text_based(
-        self, mock_path, mock_extract_text, mock_determine_method,
-        mock_find_section, mock_extract_cbc, mock_validate_pdf,
-        mock_extract_demographics, mock_validate_demographics,
-        mock_calculate, mock_interpret
-    ):
+    def test_process_pdf_successful_text_based(self, existing_path_mock):
         """Test successful PDF processing with text-based extraction."""
-        # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path_instance.absolute.return_value = Path("/test/path.pdf")
-        mock_path.return_value = mock_path_instance
-        
-        mock_determine_method.return_value = "text_based"
-        mock_extract_text.return_value = ("PDF text content", "text_based")
-        mock_find_section.return_value = "CBC section text"
-        
-        # Mock CBC extraction
-        mock_extracted_values = {
-            "neutrophils": {"value": 6310, "confidence": 95},
-            "lymphocytes": {"value": 1800, "confidence": 90},
-            "platelets": {"value": 250000, "confidence": 98}
-        }
-        mock_extract_cbc.return_value = mock_extracted_values
-        
-        # Mock validation
-        mock_validate_pdf.return_value = {
-            "valid": True,
-            "warnings": [],
-            "manual_verification_needed": False
-        }
-        
-        # Mock demographics
-        mock_demographics = {
-            "age": {"value": 45, "confidence": 85},
-            "sex": {"value": "M", "confidence": 90},
-            "test_date": {"value": "2025-06-30", "confidence": 80}
-        }
-        mock_extract_demographics.return_value = mock_demographics
-        mock_validate_demographics.return_value = {
-            "valid": True,
-            "warnings": [],
-            "manual_verification_needed": False
-        }
-        
-        # Mock calculations
-        mock_calculation_results = {
-            "results": {
-                "sii": {"value": 877.8, "risk_level": "normal"},
-                "nlr": {"value": 3.5, "risk_level": "mild"}
-            },
-            "summary": {"overall_inflammatory_status": "Normal"},
-            "metadata": {"calculation_date": "2025-06-30"}
-        }
-        mock_calculate.return_value = mock_calculation_results
-        
-        # Mock interpretation
-        mock_interpretation = {
-            "clinical_assessment": {"sii": {"clinical_significance": "Normal inflammation"}},
-            "recommendations": {"immediate": []}
-        }
-        mock_interpret.return_value = mock_interpretation
-        
-        # Execute
-        result = process_pdf("test.pdf")
-        
-        # Verify structure
-        assert "pdf_parsing" in result
-        assert "results" in result
-        assert "summary" in result
-        assert "metadata" in result
-        assert "interpretation" in result
-        
-        # Verify PDF parsing results
-        assert result["pdf_parsing"]["extraction_method"] == "text_based"
-        assert result["pdf_parsing"]["extracted_values"] == mock_extracted_values
-        assert not result["pdf_parsing"]["manual_verification_needed"]
-        
-        # Verify calculations were called with correct values
-        mock_calculate.assert_called_once_with(6310, 1800, 250000, None)
+        # calculate_indices and interpret_results are imported inside
+        # process_pdf, so they are not attributes of the pdf_parser module
+        # and must be patched at their source modules instead.
+        with patch.multiple(
+            'immune_inflam_index.pdf_parser',
+            autospec=True,
+            extract_text_from_pdf=DEFAULT,
+            determine_extraction_method=DEFAULT, find_cbc_section=DEFAULT,
+            extract_cbc_values=DEFAULT, validate_pdf_extracted_values=DEFAULT,
+            extract_patient_demographics=DEFAULT,
+            validate_demographic_extraction=DEFAULT,
+        ) as mocks, \
+                patch('immune_inflam_index.calculator.calculate_indices',
+                      autospec=True) as calculate_mock, \
+                patch('immune_inflam_index.interpreter.interpret_results',
+                      autospec=True) as interpret_mock:
+            mocks['calculate_indices'] = calculate_mock
+            mocks['interpret_results'] = interpret_mock
+            mocks['determine_extraction_method'].return_value = "text_based"
+            mocks['extract_text_from_pdf'].return_value = ("PDF text content", "text_based")
+            mocks['find_cbc_section'].return_value = "CBC section text"
+
+            # Mock CBC extraction
+            mocks['extract_cbc_values'].return_value = _SAMPLE_CBC_VALUES
+
+            # Mock validation
+            mocks['validate_pdf_extracted_values'].return_value = {
+                "valid": True,
+                "warnings": [],
+                "manual_verification_needed": False
+            }
+
+            # Mock demographics
+            mocks['extract_patient_demographics'].return_value = {
+                "age": {"value": 45, "confidence": 85},
+                "sex": {"value": "M", "confidence": 90},
+                "test_date": {"value": "2025-06-30", "confidence": 80}
+            }
+            mocks['validate_demographic_extraction'].return_value = {
+                "valid": True,
+                "warnings": [],
+                "manual_verification_needed": False
+            }
+
+            # Mock calculations
+            mocks['calculate_indices'].return_value = {
+                "results": {
+                    "sii": {"value": 877.8, "risk_level": "normal"},
+                    "nlr": {"value": 3.5, "risk_level": "mild"}
+                },
+                "summary": {"overall_inflammatory_status": "Normal"},
+                "metadata": {"calculation_date": "2025-06-30"}
+            }
+
+            # Mock interpretation
+            mocks['interpret_results'].return_value = {
+                "clinical_assessment": {"sii": {"clinical_significance": "Normal inflammation"}},
+                "recommendations": {"immediate": []}
+            }
+
+            # Execute
+            result = process_pdf("test.pdf")
+
+            # Verify structure
+            assert "pdf_parsing" in result
+            assert "results" in result
+            assert "summary" in result
+            assert "metadata" in result
+            assert "interpretation" in result
+
+            # Verify PDF parsing results
+            assert result["pdf_parsing"]["extraction_method"] == "text_based"
+            assert result["pdf_parsing"]["extracted_values"] == _SAMPLE_CBC_VALUES
+            assert not result["pdf_parsing"]["manual_verification_needed"]
+
+            # Verify calculations were called with correct values
+            mocks['calculate_indices'].assert_called_once_with(6310, 1800, 250000, None)
     
-    @patch('immune_inflam_index.pdf_parser.validate_pdf_extracted_values')
-    @patch('immune_inflam_index.pdf_parser.extract_cbc_values')
-    @patch('immune_inflam_index.pdf_parser.find_cbc_section')
-    @patch('immune_inflam_index.pdf_parser.determine_extraction_method')
-    @patch('immune_inflam_index.pdf_parser.extract_text_from_pdf')
-    @patch('immune_inflam_index.pdf_parser.Path')
-    def test_process_pdf_no_cbc_values(
-        self, mock_path, mock_extract_text, mock_determine_method,
-        mock_find_section, mock_extract_cbc, mock_validate_pdf
-    ):
+    def test_process_pdf_no_cbc_values(self, existing_path_mock):
         """Test PDF processing when no CBC values are found."""
-        # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
-        
-        mock_determine_method.return_value = "text_based"
-        mock_extract_text.return_value = ("PDF text content", "text_based")
-        mock_find_section.return_value = "CBC section text"
-        mock_extract_cbc.return_value = {}  # No values found
-        
-        with pytest.raises(PDFParsingError, match="No CBC values found in PDF"):
-            process_pdf("test.pdf")
+        with patch.multiple(
+            'immune_inflam_index.pdf_parser',
+            autospec=True,
+            extract_text_from_pdf=DEFAULT,
+            determine_extraction_method=DEFAULT, find_cbc_section=DEFAULT,
+            extract_cbc_values=DEFAULT, validate_pdf_extracted_values=DEFAULT
+        ) as mocks:
+            mocks['determine_extraction_method'].return_value = "text_based"
+            mocks['extract_text_from_pdf'].return_value = ("PDF text content", "text_based")
+            mocks['find_cbc_section'].return_value = "CBC section text"
+            mocks['extract_cbc_values'].return_value = {}  # No values found
+
+            with pytest.raises(PDFParsingError, match="No CBC values found in PDF"):
+                process_pdf("test.pdf")
     
-    @patch('immune_inflam_index.pdf_parser.extract_text_from_pdf')
-    @patch('immune_inflam_index.pdf_parser.extract_text_with_ocr')
-    @patch('immune_inflam_index.pdf_parser.determine_extraction_method')
-    @patch('immune_inflam_index.pdf_parser.Path')
-    def test_process_pdf_no_text_extracted(
-        self, mock_path, mock_determine_method, mock_extract_ocr, mock_extract_text
-    ):
+    def test_process_pdf_no_text_extracted(self, existing_path_mock):
         """Test PDF processing when no text can be extracted."""
-        # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
-        
-        mock_determine_method.return_value = "text_based"
-        mock_extract_text.return_value = ("", "text_based_failed")  # No text
-        
-        with pytest.raises(PDFParsingError, match="No text could be extracted from PDF"):
-            process_pdf("test.pdf")
+        with patch.multiple(
+            'immune_inflam_index.pdf_parser',
+            autospec=True,
+            extract_text_from_pdf=DEFAULT,
+            extract_text_with_ocr=DEFAULT, determine_extraction_method=DEFAULT
+        ) as mocks:
+            mocks['determine_extraction_method'].return_value = "text_based"
+            mocks['extract_text_from_pdf'].return_value = ("", "text_based_failed")  # No text
+
+            with pytest.raises(PDFParsingError, match="No text could be extracted from PDF"):
+                process_pdf("test.pdf")
     
-    @patch('immune_inflam_index.pdf_parser.validate_pdf_extracted_values')
-    @patch('immune_inflam_index.pdf_parser.extract_cbc_values')
-    @patch('immune_inflam_index.pdf_parser.find_cbc_section')
-    @patch('immune_inflam_index.pdf_parser.determine_extraction_method')
-    @patch('immune_inflam_index.pdf_parser.extract_text_from_pdf')
-    @patch('immune_inflam_index.pdf_parser.Path')
-    def test_process_pdf_validation_failure(
-        self, mock_path, mock_extract_text, mock_determine_method,
-        mock_find_section, mock_extract_cbc, mock_validate_pdf
-    ):
+    def test_process_pdf_validation_failure(self, existing_path_mock):
         """Test PDF processing when validation fails."""
-        # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
-        
-        mock_determine_method.return_value = "text_based"
-        mock_extract_text.return_value = ("PDF text content", "text_based")
-        mock_find_section.return_value = "CBC section text"
-        
-        mock_extracted_values = {
-            "neutrophils": {"value": 6310, "confidence": 95}
-        }
-        mock_extract_cbc.return_value = mock_extracted_values
-        
-        # Mock validation failure
-        mock_validate_pdf.return_value = {
-            "valid": False,
-            "errors": ["Missing required fields"],
-            "individual_results": {
-                "neutrophils": {"valid": True},
-                "lymphocytes": {"valid": False}
+        with patch.multiple(
+            'immune_inflam_index.pdf_parser',
+            autospec=True,
+            extract_text_from_pdf=DEFAULT,
+            determine_extraction_method=DEFAULT, find_cbc_section=DEFAULT,
+            extract_cbc_values=DEFAULT, validate_pdf_extracted_values=DEFAULT
+        ) as mocks:
+            mocks['determine_extraction_method'].return_value = "text_based"
+            mocks['extract_text_from_pdf'].return_value = ("PDF text content", "text_based")
+            mocks['find_cbc_section'].return_value = "CBC section text"
+
+            mocks['extract_cbc_values'].return_value = {
+                "neutrophils": {"value": 6310, "confidence": 95}
             }
-        }
-        
-        with pytest.raises(PDFParsingError, match="Validation failed"):
-            process_pdf("test.pdf")
+
+            # Mock validation failure
+            mocks['validate_pdf_extracted_values'].return_value = {
+                "valid": False,
+                "errors": ["Missing required fields"],
+                "individual_results": {
+                    "neutrophils": {"valid": True},
+                    "lymphocytes": {"valid": False}
+                }
+            }
+
+            with pytest.raises(PDFParsingError, match="Validation failed"):
+                process_pdf("test.pdf")
 
 
 class TestManualFallbackMode:
     """Test manual fallback functionality."""
     
-    @patch('immune_inflam_index.pdf_parser.parse_value_with_unit')
+    @patch.object(_pp, 'parse_value_with_unit')
     @patch('immune_inflam_index.pdf_parser.Prompt.ask')
     @patch('immune_inflam_index.pdf_parser.Console')
     def test_manual_fallback_success(self, mock_console, mock_prompt, mock_parse):
         """Test successful manual value entry."""
         # Mock user inputs
-        mock_prompt.side_effect = ["6310", "1800", "250000", ""]  # Empty for monocytes
+        mock_prompt.side_effect = iter(("6310", "1800", "250000", ""))  # Empty for monocytes
         
         # Mock value parsing
-        mock_parse.side_effect = [
+        mock_parse.side_effect = iter((
             (6310.0, "cells/µL"),
             (1800.0, "cells/µL"),
             (250000.0, "cells/µL")
-        ]
+        ))
         
         result = manual_fallback_mode("extracted text", ["neutrophils", "lymphocytes", "platelets"])
         
@@ -478,19 +495,19 @@ class TestManualFallbackMode:
         assert result["platelets"] == 250000.0
         assert "monocytes" not in result  # Skipped
     
-    @patch('immune_inflam_index.pdf_parser.parse_value_with_unit')
+    @patch.object(_pp, 'parse_value_with_unit')
     @patch('immune_inflam_index.pdf_parser.Prompt.ask')
     @patch('immune_inflam_index.pdf_parser.Console')
     def test_manual_fallback_invalid_input_retry(self, mock_console, mock_prompt, mock_parse):
         """Test retry logic for invalid input."""
         # Mock user inputs - first invalid, then valid
-        mock_prompt.side_effect = ["invalid", "6310"]
+        mock_prompt.side_effect = iter(("invalid", "6310"))
         
         # Mock value parsing - first fails, then succeeds
-        mock_parse.side_effect = [
+        mock_parse.side_effect = iter((
             (None, None),      # Invalid input
             (6310.0, "cells/µL")  # Valid input
-        ]
+        ))
         
         result = manual_fallback_mode("extracted text", ["neutrophils"])
         
@@ -506,19 +523,24 @@ class TestEdgeCasesAndErrorHandling:
         result = find_cbc_section("")
         assert result == ""
     
-    def test_find_cbc_section_very_long_text(self):
-        """Test CBC section finding with very long text."""
-        long_text = "A" * 5000  # Very long text without headers
-        result = find_cbc_section(long_text)
-        
+    def test_find_cbc_section_very_long_text(self, benchmark):
+        """Test CBC section finding with very long text stays fast."""
+        # Benchmark the real function, not the module-level cached wrapper,
+        # so the timings reflect the actual scan. This records numbers for
+        # inspection only: pytest-benchmark has no pass/fail budget here
+        # and disables itself under xdist, so a superlinear regression
+        # only shows up in a dedicated `pytest -p no:xdist --benchmark-only`
+        # run (or with --benchmark-compare-fail against a saved baseline).
+        result = benchmark(_pp.find_cbc_section, _LONG_TEXT)
+
         # Should return first 2000 characters
         assert len(result) == 2000
-        assert result == long_text[:2000]
+        assert result == _LONG_TEXT[:2000]
     
-    @patch('immune_inflam_index.pdf_parser.Path')
+    @patch.object(_pp, 'Path')
     def test_process_pdf_unexpected_error(self, mock_path):
         """Test handling of unexpected errors during processing."""
-        mock_path.side_effect = Exception("Unexpected error")
+        mock_path.side_effect = _UNEXPECTED_ERR
         
         with pytest.raises(PDFParsingError, match="Unexpected error during PDF processing"):
             process_pdf("test.pdf")
@@ -527,13 +549,14 @@ class TestEdgeCasesAndErrorHandling:
 class TestIntegrationScenarios:
     """Test integration scenarios with synthetic PDFs."""
     
+    @pytest.mark.slow
     def test_process_synthetic_pdf_standard(self, sample_pdf_path):
         """Test processing of synthetic standard PDF."""
         # This test would use actual synthetic PDFs from fixtures
         # For now, we'll test the structure that would be expected
         
         # Mock the processing of a standard synthetic PDF
-        with patch('immune_inflam_index.pdf_parser.Path') as mock_path:
+        with patch.object(_pp, 'Path') as mock_path:
             mock_path_instance = MagicMock()
             mock_path_instance.exists.return_value = True
             mock_path.return_value = mock_path_instance
@@ -542,59 +565,65 @@ class TestIntegrationScenarios:
             # This test validates end-to-end functionality
             assert True  # Placeholder - would have real assertions
     
+    @pytest.mark.slow
     def test_process_synthetic_pdf_scanned(self, sample_scanned_pdf_path):
         """Test processing of synthetic scanned PDF."""
         # Similar integration test for OCR functionality
         assert True  # Placeholder
 
 
+@pytest.fixture
+def process_pdf_happy_path_mocks(existing_path_mock):
+    """Fully configured happy-path mocks for process_pdf regression tests."""
+    # calculate_indices and interpret_results are imported inside
+    # process_pdf, so they are not attributes of the pdf_parser module and
+    # must be patched at their source modules instead.
+    with patch.multiple(
+        'immune_inflam_index.pdf_parser',
+        determine_extraction_method=DEFAULT, extract_text_from_pdf=DEFAULT,
+        find_cbc_section=DEFAULT, extract_cbc_values=DEFAULT,
+        validate_pdf_extracted_values=DEFAULT,
+        extract_patient_demographics=DEFAULT,
+        validate_demographic_extraction=DEFAULT,
+    ) as mocks, \
+            patch('immune_inflam_index.calculator.calculate_indices') as calculate_mock, \
+            patch('immune_inflam_index.interpreter.interpret_results') as interpret_mock:
+        mocks['calculate_indices'] = calculate_mock
+        mocks['interpret_results'] = interpret_mock
+        mocks['determine_extraction_method'].return_value = "text_based"
+        mocks['extract_text_from_pdf'].return_value = ("text", "method")
+        mocks['find_cbc_section'].return_value = "cbc text"
+        mocks['extract_cbc_values'].return_value = _SAMPLE_CBC_VALUES
+        mocks['validate_pdf_extracted_values'].return_value = {
+            "valid": True, "warnings": [], "manual_verification_needed": False
+        }
+        mocks['extract_patient_demographics'].return_value = {
+            "age": {"value": 30, "confidence": 70},  # Low confidence
+            "sex": {"value": "F", "confidence": 60},  # Low confidence
+            "test_date": {"value": "2025-06-30", "confidence": 80}
+        }
+        mocks['validate_demographic_extraction'].return_value = {
+            "valid": True, "warnings": [], "manual_verification_needed": False
+        }
+        mocks['calculate_indices'].return_value = {
+            "results": {}, "summary": {}, "metadata": {}
+        }
+        mocks['interpret_results'].return_value = {}
+        yield mocks
+
+
 class TestRegressionTests:
     """Regression tests for known PDF processing scenarios."""
-    
-    def test_process_pdf_with_manual_demographics(self):
+
+    def test_process_pdf_with_manual_demographics(self, process_pdf_happy_path_mocks):
         """Test PDF processing with manually provided demographics."""
         # Test that manual demographics override extracted ones
-        with patch.multiple(
-            'immune_inflam_index.pdf_parser',
-            Path=MagicMock(),
-            determine_extraction_method=MagicMock(return_value="text_based"),
-            extract_text_from_pdf=MagicMock(return_value=("text", "method")),
-            find_cbc_section=MagicMock(return_value="cbc text"),
-            extract_cbc_values=MagicMock(return_value={
-                "neutrophils": {"value": 6310, "confidence": 95},
-                "lymphocytes": {"value": 1800, "confidence": 90},
-                "platelets": {"value": 250000, "confidence": 98}
-            }),
-            validate_pdf_extracted_values=MagicMock(return_value={
-                "valid": True, "warnings": [], "manual_verification_needed": False
-            }),
-            extract_patient_demographics=MagicMock(return_value={
-                "age": {"value": 30, "confidence": 70},  # Low confidence
-                "sex": {"value": "F", "confidence": 60},  # Low confidence
-                "test_date": {"value": "2025-06-30", "confidence": 80}
-            }),
-            validate_demographic_extraction=MagicMock(return_value={
-                "valid": True, "warnings": [], "manual_verification_needed": False
-            }),
-            calculate_indices=MagicMock(return_value={
-                "results": {}, "summary": {}, "metadata": {}
-            }),
-            interpret_results=MagicMock(return_value={})
-        ):
-            # Mock file existence
-            with patch('immune_inflam_index.pdf_parser.Path') as mock_path:
-                mock_path_instance = MagicMock()
-                mock_path_instance.exists.return_value = True
-                mock_path_instance.absolute.return_value = Path("/test/path.pdf")
-                mock_path.return_value = mock_path_instance
-                
-                # Process with manual demographics
-                result = process_pdf("test.pdf", patient_age=45, patient_sex="M")
-                
-                # Should use manual demographics despite extracted ones
-                # Verify through the interpret_results call arguments
-                from immune_inflam_index.pdf_parser import interpret_results
-                interpret_results.assert_called_once()
-                call_args = interpret_results.call_args
-                assert call_args[1]['patient_age'] == 45
-                assert call_args[1]['patient_sex'] == "M"
\ No newline at end of file
+        result = process_pdf("test.pdf", patient_age=45, patient_sex="M")
+
+        # Should use manual demographics despite extracted ones
+        # Verify through the interpret_results call arguments
+        interpret_mock = process_pdf_happy_path_mocks['interpret_results']
+        interpret_mock.assert_called_once()
+        call_args = interpret_mock.call_args
+        assert call_args[1]['patient_age'] == 45
+        assert call_args[1]['patient_sex'] == "M"
\ No newline at end of file